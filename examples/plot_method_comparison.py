@@ -17,8 +17,10 @@ accuracy on the test set.
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
+from joblib import Parallel, delayed
 from matplotlib.colors import ListedColormap
-from sklearn.inspection import DecisionBoundaryDisplay
+from sklearn.base import clone
 from sklearn.neighbors import KernelDensity
 from sklearn.svm import SVC
 
@@ -92,6 +94,9 @@ classifiers = [
     MMDLSConSMapping(base_estimator=SVC()),
 ]
 
+# zip would silently drop the classifiers without a name (or the converse)
+assert len(names) == len(classifiers), "one name is expected per classifier"
+
 datasets = [
     make_shifted_datasets(
         n_samples_source=20,
@@ -131,6 +136,31 @@ datasets = [
     ),
 ]
 
+
+def fit_score(name, clf, ds):
+    """Fit a copy of the classifier on a dataset and score it on the target"""
+    X, y, sample_domain = ds.pack_train(as_sources=["s"], as_targets=["t"])
+    Xs, ys = ds.get_domain("s")
+    Xt, yt = ds.get_domain("t")
+    clf = clone(clf)
+    if name == "Without da":
+        clf.fit(Xs, ys)
+    else:
+        clf.fit(X, y, sample_domain=sample_domain)
+    return clf, clf.score(Xt, yt)
+
+
+# The fits are independent from each other: run them all in parallel
+# and keep only the plotting in the main process
+results = Parallel(n_jobs=-1)(
+    delayed(fit_score)(name, clf, ds)
+    for ds in datasets
+    for name, clf in zip(names, classifiers)
+)
+results = [
+    results[i : i + len(classifiers)] for i in range(0, len(results), len(classifiers))
+]
+
 figure, axes = plt.subplots(len(classifiers) + 2, len(datasets), figsize=(9, 27))
 # iterate over datasets
 for ds_cnt, ds in enumerate(datasets):
@@ -141,9 +171,14 @@ for ds_cnt, ds in enumerate(datasets):
 
     x_min, x_max = X[:, 0].min() - 0.5, X[:, 0].max() + 0.5
     y_min, y_max = X[:, 1].min() - 0.5, X[:, 1].max() + 0.5
+    # the grid only depends on the dataset, build it once for all classifiers
+    xx, yy = np.meshgrid(np.linspace(x_min, x_max, 100), np.linspace(y_min, y_max, 100))
+    grid = np.c_[xx.ravel(), yy.ravel()]
     # just plot the dataset first
     cm = plt.cm.RdBu
     cm_bright = ListedColormap(["#FF0000", "#0000FF"])
+    # the target points are drawn under every classifier, map their colors once
+    target_colors = cm_bright(yt)
     ax = axes[0, ds_cnt]
     if ds_cnt == 0:
         ax.set_ylabel("Source data")
@@ -171,8 +206,7 @@ for ds_cnt, ds in enumerate(datasets):
     ax.scatter(
         Xt[:, 0],
         Xt[:, 1],
-        c=yt,
-        cmap=cm_bright,
+        c=target_colors,
         alpha=0.5,
     )
     ax.set_xlim(x_min, x_max)
@@ -182,32 +216,19 @@ for ds_cnt, ds in enumerate(datasets):
     i = 2
 
     # iterate over classifiers
-    for name, clf in zip(names, classifiers):
-        print(name, clf)
+    for name, (clf, score) in zip(names, results[ds_cnt]):
         ax = axes[i, ds_cnt]
         ax.set_xlim(x_min, x_max)
         ax.set_ylim(y_min, y_max)
-        if name == "Without da":
-            clf.fit(Xs, ys)
-        else:
-            clf.fit(X, y, sample_domain=sample_domain)
-        score = clf.score(Xt, yt)
-        DecisionBoundaryDisplay.from_estimator(
-            clf,
-            X,
-            cmap=cm,
-            alpha=0.8,
-            ax=ax,
-            eps=0.5,
-            response_method="predict",
-        )
+        # plot the decision boundary
+        Z = clf.predict(grid).reshape(xx.shape)
+        ax.contourf(xx, yy, Z, cmap=cm, alpha=0.8)
 
         # Plot the target points
         ax.scatter(
             Xt[:, 0],
             Xt[:, 1],
-            c=yt,
-            cmap=cm_bright,
+            c=target_colors,
             alpha=0.5,
         )
 
@@ -222,12 +222,14 @@ class DASVMClassifier(DAEstimator):
             if self.save_estimators:
                 self.estimators.append(new_estimator)
 
-            for j in range(len(index_target_added)):
-                if index_target_added[j]:
-                    x = Xt[j]
-                    if new_estimator.predict([x]) != old_estimator.predict([x]):
-                        # index_target_added[j] should be True
-                        index_target_added[j] = False
+            # Discard the added target points whose semi-label changed,
+            # with one batched predict per estimator instead of one per point
+            added = np.flatnonzero(index_target_added)
+            if len(added) > 0:
+                changed = new_estimator.predict(Xt[added]) != old_estimator.predict(
+                    Xt[added]
+                )
+                index_target_added[added[changed]] = False
 
             decisions_source = self._get_decision(
                 new_estimator, Xs, index_source_deleted
@@ -778,7 +778,8 @@ class TransferSubspaceLearningAdapter(BaseAdapter):
         n_samples, d = X.shape
         X = X - torch.mean(X, dim=0)
         cov = X.T @ X / n_samples
-        cov = (1 - reg) * cov + reg * torch.trace(cov) * torch.eye(d)
+        # shrink towards trace(cov) * I in a single fused blend
+        cov = torch.lerp(cov, torch.trace(cov) * torch.eye(d, dtype=cov.dtype), reg)
 
         return cov
 
@@ -798,36 +799,61 @@ class TransferSubspaceLearningAdapter(BaseAdapter):
         L_11 = torch.linalg.cholesky(torch.linalg.inv(sigma_11))
         L_12 = torch.linalg.cholesky(torch.linalg.inv(sigma_12))
         L_22 = torch.linalg.cholesky(torch.linalg.inv(sigma_22))
-        Kss = torch.exp(-0.5 * torch.cdist(Z_source @ L_11, Z_source @ L_11))
+        # whiten each projection once and reuse it on both sides of cdist
+        Z_source_11 = Z_source @ L_11
+        Z_target_22 = Z_target @ L_22
+        Kss = torch.exp(-0.5 * torch.cdist(Z_source_11, Z_source_11))
         Kst = torch.exp(-0.5 * torch.cdist(Z_source @ L_12, Z_target @ L_12))
-        Ktt = torch.exp(-0.5 * torch.cdist(Z_target @ L_22, Z_target @ L_22))
+        Ktt = torch.exp(-0.5 * torch.cdist(Z_target_22, Z_target_22))
 
         return torch.mean(Kss) + torch.mean(Ktt) - 2 * torch.mean(Kst)
 
-    def _F(self, W, X_source, y_source):
-        """Subspace learning objective function"""
+    def _F_matrices(self, X_source, y_source):
+        """Matrices of the subspace learning objective.
+
+        They do not depend on W and are computed once per fit.
+        """
         torch = self.torch
         base_method = self.base_method
 
         if base_method == "pca":
-            cov = self._torch_cov(X_source)
-            loss = -torch.trace(W.T @ cov @ W)
+            matrices = (self._torch_cov(X_source),)
         elif base_method == "flda":
-            classes = torch.unique(y_source)
-            classes_means = torch.stack(
-                [torch.mean(X_source[y_source == c], dim=0) for c in classes]
+            classes, y_indices, classes_n_samples = torch.unique(
+                y_source, return_inverse=True, return_counts=True
+            )
+            classes_sums = torch.zeros(
+                (len(classes), X_source.shape[1]), dtype=X_source.dtype
             )
-            classes_n_samples = torch.stack([torch.sum(y_source == c) for c in classes])
-            classes_means = classes_means * torch.sqrt(classes_n_samples).reshape(-1, 1)
+            classes_sums.index_add_(0, y_indices, X_source)
+            # mean_c * sqrt(n_c) == sum_c / sqrt(n_c)
+            classes_means = classes_sums / torch.sqrt(classes_n_samples).reshape(-1, 1)
             S_W = self._torch_cov(classes_means)
             S_B = self._torch_cov(X_source)
-            loss = torch.trace(W.T @ S_W @ W) / torch.trace(W.T @ S_B @ W)
+            matrices = (S_W, S_B)
         elif base_method == "lpp":
             # E is the Gaussian kernel if (y_source)_i == (y_source)_j and 0 otherwise
             E = torch.exp(-torch.cdist(X_source, X_source) / self.length_scale)
             E = E * (y_source[:, None] == y_source[None, :])
             D = torch.diag(torch.sum(E, dim=1))
-            loss = -2 * torch.trace(W.T @ X_source.T @ (D - E) @ X_source @ W)
+            matrices = (X_source.T @ (D - E) @ X_source,)
+
+        return matrices
+
+    def _F(self, W, matrices):
+        """Subspace learning objective function"""
+        torch = self.torch
+        base_method = self.base_method
+
+        if base_method == "pca":
+            (cov,) = matrices
+            loss = -torch.trace(W.T @ cov @ W)
+        elif base_method == "flda":
+            S_W, S_B = matrices
+            loss = torch.trace(W.T @ S_W @ W) / torch.trace(W.T @ S_B @ W)
+        elif base_method == "lpp":
+            (L,) = matrices
+            loss = -2 * torch.trace(W.T @ L @ W)
 
         return loss
 
@@ -888,9 +914,12 @@ class TransferSubspaceLearningAdapter(BaseAdapter):
                 W = torch.linalg.qr(W)[0]
             return W
 
+        # the subspace learning matrices do not depend on W
+        F_matrices = self._F_matrices(X_source, y_source)
+
         def func(W):
             W = _orth(W)
-            loss = self._F(W, X_source, y_source)
+            loss = self._F(W, F_matrices)
             loss = loss + self.mu * self._D(W, X_source, X_target)
             return loss
 
@@ -220,6 +220,10 @@ class CDANModule(DomainAwareModule):
         Maximum size of the input for the domain classifier.
         4096 is the largest number of units in typical deep network
         according to [1]_.
+    random_state : int, Generator instance or None, default=42
+        Seed for the random multilinear map used when the domain classifier
+        input exceeds max_features. The map is drawn once per fit.
+        An int reseeds the global torch RNG.
 
     References
     ----------
@@ -238,12 +242,32 @@ class CDANModule(DomainAwareModule):
         super().__init__(base_module, layer_name, domain_classifier)
         self.max_features = max_features
         self.random_state = random_state
+        self.random_layer_ = None
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # the random layer is only built at the first training batch,
+        # create it from the saved matrices so that they can be loaded
+        layer_prefix = prefix + "random_layer_.random_matrix_"
+        matrices = [
+            value for key, value in state_dict.items() if key.startswith(layer_prefix)
+        ]
+        if self.random_layer_ is None and len(matrices) > 0:
+            # a local generator leaves the global torch RNG untouched,
+            # the values are overwritten by the loaded ones
+            self.random_layer_ = _RandomLayer(
+                torch.Generator(),
+                input_dims=[matrix.shape[0] for matrix in matrices],
+                output_dim=matrices[0].shape[1],
+            )
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
 
     def forward(self, X, sample_domain=None, is_fit=False, return_features=False):
         if is_fit:
-            source_idx = sample_domain >= 0
+            # integer indices avoid a mask to index conversion at each use
+            source_idx = torch.nonzero(sample_domain >= 0, as_tuple=True)[0]
+            target_idx = torch.nonzero(sample_domain < 0, as_tuple=True)[0]
 
-            X_t = X[~source_idx]
+            X_t = X[target_idx]
             X_s = X[source_idx]
             # predict
             y_pred_s = self.base_module_(X_s)
@@ -254,11 +278,14 @@ class CDANModule(DomainAwareModule):
             n_classes = y_pred_s.shape[1]
             n_features = features_s.shape[1]
             if n_features * n_classes > self.max_features:
-                random_layer = _RandomLayer(
-                    self.random_state,
-                    input_dims=[n_features, n_classes],
-                    output_dim=self.max_features,
-                )
+                if self.random_layer_ is None:
+                    # draw the random matrices once and reuse them for all batches
+                    self.random_layer_ = _RandomLayer(
+                        self.random_state,
+                        input_dims=[n_features, n_classes],
+                        output_dim=self.max_features,
+                    ).to(features_s.device)
+                random_layer = self.random_layer_
             else:
                 random_layer = None
 
@@ -284,19 +311,19 @@ class CDANModule(DomainAwareModule):
             domain_pred_t = self.domain_classifier_(multilinear_map_target)
             domain_pred = torch.empty(len(sample_domain), device=domain_pred_s.device)
             domain_pred[source_idx] = domain_pred_s
-            domain_pred[~source_idx] = domain_pred_t
+            domain_pred[target_idx] = domain_pred_t
 
             y_pred = torch.empty(
                 (len(sample_domain), y_pred_s.shape[1]), device=y_pred_s.device
             )
             y_pred[source_idx] = y_pred_s
-            y_pred[~source_idx] = y_pred_t
+            y_pred[target_idx] = y_pred_t
 
             features = torch.empty(
                 (len(sample_domain), features_s.shape[1]), device=features_s.device
             )
             features[source_idx] = features_s
-            features[~source_idx] = features_t
+            features[target_idx] = features_t
 
             return (
                 y_pred,
@@ -405,20 +432,24 @@ class _RandomLayer(nn.Module):
         super().__init__()
         gen = check_generator(random_state)
         self.output_dim = output_dim
-        self.random_matrix = [
-            torch.randn(size=(input_dims[i], output_dim), generator=gen)
-            for i in range(len(input_dims))
-        ]
+        self.n_inputs = len(input_dims)
+        # buffers follow the module device and are saved in its state dict
+        for i in range(self.n_inputs):
+            self.register_buffer(
+                f"random_matrix_{i}",
+                torch.randn(size=(input_dims[i], output_dim), generator=gen),
+            )
+
+    @property
+    def random_matrix(self):
+        return [getattr(self, f"random_matrix_{i}") for i in range(self.n_inputs)]
 
     def forward(self, input_list):
-        device = input_list[0].device
-        return_list = [
-            torch.mm(input_list[i], self.random_matrix[i].to(device))
-            for i in range(len(input_list))
-        ]
-        return_tensor = return_list[0] / math.pow(
-            float(self.output_dim), 1.0 / len(input_list)
+        # accumulate the product as the projections are computed
+        # instead of keeping all of them in a list
+        return_tensor = torch.mm(input_list[0], self.random_matrix[0]).div_(
+            math.pow(float(self.output_dim), 1.0 / len(input_list))
         )
-        for single in return_list[1:]:
-            return_tensor = torch.mul(return_tensor, single)
+        for single, matrix in zip(input_list[1:], self.random_matrix[1:]):
+            return_tensor = return_tensor * torch.mm(single, matrix)
         return return_tensor
@@ -58,25 +58,28 @@ class DomainAwareCriterion(torch.nn.Module):
             The true labels. Available for source, masked for target.
         """
         y_pred, domain_pred, features, sample_domain = y_pred  # unpack
-        source_idx = (sample_domain >= 0)
+        # compute the indices once and reuse them for every output,
+        # integer indices avoid a mask to index conversion at each use
+        source_idx = torch.nonzero(sample_domain >= 0, as_tuple=True)[0]
+        target_idx = torch.nonzero(sample_domain < 0, as_tuple=True)[0]
         y_pred_s = y_pred[source_idx]
-        y_pred_t = y_pred[~source_idx]
+        y_pred_t = y_pred[target_idx]
 
         if domain_pred is not None:
             domain_pred_s = domain_pred[source_idx]
-            domain_pred_t = domain_pred[~source_idx]
+            domain_pred_t = domain_pred[target_idx]
         else:
             domain_pred_s = None
             domain_pred_t = None
 
         features_s = features[source_idx]
-        features_t = features[~source_idx]
+        features_t = features[target_idx]
+
+        y_s = y_true[source_idx]
 
         # predict
-        return self.criterion(
-            y_pred_s, y_true[source_idx]
-        ) + self.reg * self.adapt_criterion(
-            y_true[source_idx],
+        return self.criterion(y_pred_s, y_s) + self.reg * self.adapt_criterion(
+            y_s,
             y_pred_s,
             y_pred_t,
             domain_pred_s,
@@ -257,10 +260,12 @@ class DomainAwareModule(torch.nn.Module):
 
     def forward(self, X, sample_domain=None, is_fit=False, return_features=False):
         if is_fit:
-            source_idx = (sample_domain >= 0)
+            # integer indices avoid a mask to index conversion at each use
+            source_idx = torch.nonzero(sample_domain >= 0, as_tuple=True)[0]
+            target_idx = torch.nonzero(sample_domain < 0, as_tuple=True)[0]
 
             X_s = X[source_idx]
-            X_t = X[~source_idx]
+            X_t = X[target_idx]
             # predict
             y_pred_s = self.base_module_(X_s)
             features_s = self.intermediate_layers[self.layer_name]
@@ -275,7 +280,7 @@ class DomainAwareModule(torch.nn.Module):
                     device=domain_pred_s.device
                 )
                 domain_pred[source_idx] = domain_pred_s
-                domain_pred[~source_idx] = domain_pred_t
+                domain_pred[target_idx] = domain_pred_t
             else:
                 domain_pred = None
 
@@ -284,14 +289,14 @@ class DomainAwareModule(torch.nn.Module):
                 device=y_pred_s.device
             )
             y_pred[source_idx] = y_pred_s
-            y_pred[~source_idx] = y_pred_t
+            y_pred[target_idx] = y_pred_t
 
             features = torch.empty(
                 (len(sample_domain), features_s.shape[1]),
                 device=features_s.device
             )
             features[source_idx] = features_s
-            features[~source_idx] = features_t
+            features[target_idx] = features_t
 
             return (
                 y_pred,
@@ -483,6 +488,10 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
     def predict_features(self, X):
         """get features
 
+        The features are computed batch by batch, using the net's
+        ``batch_size``, so that only one batch at a time is moved to
+        the device.
+
         Parameters
         ----------
         X : dict, torch tensor, array-like or torch dataset
@@ -494,10 +503,31 @@ class DomainAwareNet(NeuralNetClassifier, _DAMetadataRequesterMixin):
         if not self.initialized_:
             self.initialize()
 
-        if not torch.is_tensor(X):
-            X = torch.tensor(X)
-
-        _, features = self.module_(
-            X, sample_domain=None, is_fit=False, return_features=True
-        )
+        X = torch.as_tensor(X)
+        batch_size = len(X) if self.batch_size == -1 else self.batch_size
+
+        # restore the mode of the module afterwards, e.g. when called
+        # from a callback during training
+        training = self.module_.training
+        self.module_.eval()
+        features = None
+        start = 0
+        try:
+            with torch.no_grad():
+                for X_batch in torch.split(X, batch_size):
+                    # no copy if X is already a tensor on the right device
+                    X_batch = X_batch.to(self.device)
+                    _, features_batch = self.module_(
+                        X_batch, sample_domain=None, is_fit=False, return_features=True
+                    )
+                    if features is None:
+                        # allocate the output once the number of features is known
+                        # and fill it in place instead of concatenating the batches
+                        features = features_batch.new_empty(
+                            (len(X), features_batch.shape[1])
+                        )
+                    features[start : start + len(X_batch)] = features_batch
+                    start += len(X_batch)
+        finally:
+            self.module_.train(training)
         return features
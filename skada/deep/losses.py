@@ -92,12 +92,13 @@ def deepjdot_loss(
     """
     dist = torch.cdist(features_s, features_t, p=2) ** 2
 
-    y_target_matrix = y_pred_t.repeat(len(y_pred_t), 1, 1).permute(1, 2, 0)
-
     if criterion is None:
-        criterion = torch.nn.CrossEntropyLoss(reduction="none")
-
-    loss_target = criterion(y_target_matrix, y_s.repeat(len(y_s), 1)).T
+        # cross entropy of each (source label, target prediction) pair:
+        # a single log-softmax pass instead of one per source sample
+        loss_target = -torch.log_softmax(y_pred_t, dim=1)[:, y_s].T
+    else:
+        y_target_matrix = y_pred_t.repeat(len(y_pred_t), 1, 1).permute(1, 2, 0)
+        loss_target = criterion(y_target_matrix, y_s.repeat(len(y_s), 1)).T
     M = dist + reg_cl * loss_target
 
     # Compute the loss
@@ -162,14 +163,13 @@ def dan_loss(features_s, features_t, sigmas=None):
     """
     if sigmas is None:
         median_pairwise_distance = torch.median(torch.cdist(features_s, features_s))
+        # 2 ** (-8), 2 ** (-7.5), ..., 2 ** 8 built directly on the device
         sigmas = (
-            torch.tensor([2 ** (-8) * 2 ** (i * 1 / 2) for i in range(33)]).to(
-                features_s.device
-            )
+            torch.pow(2.0, torch.arange(-8, 8.5, 0.5, device=features_s.device))
             * median_pairwise_distance
         )
     else:
-        sigmas = torch.tensor(sigmas).to(features_s.device)
+        sigmas = torch.as_tensor(sigmas, device=features_s.device)
 
     gaussian_kernel = partial(_gaussian_kernel, sigmas=sigmas)
 
@@ -74,10 +74,11 @@ class ToyCNN(nn.Module):
         return x
 
     def _num_features(self, n_channels, input_size):
+        training = self.feature_extractor.training
         self.feature_extractor.eval()
         with torch.no_grad():
             out = self.feature_extractor(torch.Tensor(1, n_channels, input_size))
-        self.feature_extractor.train()
+        self.feature_extractor.train(training)
         return len(out.flatten())
 
 
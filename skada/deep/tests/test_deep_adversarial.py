@@ -7,6 +7,7 @@ import pytest
 torch = pytest.importorskip("torch")
 
 import numpy as np
+from skorch.callbacks import Callback
 from torch.nn import BCELoss
 
 from skada.datasets import make_shifted_datasets
@@ -114,6 +115,79 @@ def test_cdan(domain_classifier, domain_criterion, num_feature, max_feature, n_c
     assert history[0]["train_loss"] > history[-1]["train_loss"]
 
 
+def test_cdan_random_layer_is_reused():
+    class RecordRandomLayer(Callback):
+        def initialize(self):
+            self.layers_ = []
+            self.matrices_ = []
+            return self
+
+        def on_batch_end(self, net, batch=None, training=None, **kwargs):
+            if training:
+                layer = net.module_.random_layer_
+                self.layers_.append(layer)
+                self.matrices_.append([m.clone() for m in layer.random_matrix])
+
+    n_samples = 20
+    dataset = make_shifted_datasets(
+        n_samples_source=n_samples,
+        n_samples_target=n_samples,
+        shift="concept_drift",
+        noise=0.1,
+        random_state=42,
+        return_dataset=True,
+    )
+
+    recorder = RecordRandomLayer()
+    # num_features * n_classes > max_features: the random layer is used
+    method = CDAN(
+        ToyModule2D(),
+        reg=1,
+        num_features=10,
+        n_classes=2,
+        max_features=10,
+        layer_name="dropout",
+        batch_size=10,
+        max_epochs=2,
+        train_split=None,
+        callbacks=[recorder],
+    )
+
+    X, y, sample_domain = dataset.pack_train(as_sources=["s"], as_targets=["t"])
+    method.fit(X.astype(np.float32), y, sample_domain)
+
+    random_layer = method.module_.random_layer_
+    assert random_layer is not None
+    assert len(recorder.layers_) > 1
+    assert all(layer is random_layer for layer in recorder.layers_)
+    for matrices in recorder.matrices_:
+        for matrix, first_matrix in zip(matrices, recorder.matrices_[0]):
+            assert torch.equal(matrix, first_matrix)
+    device = next(method.module_.parameters()).device
+    assert all(matrix.device == device for matrix in random_layer.random_matrix)
+
+    # the random map is saved in the state dict and can be loaded back
+    state_dict = method.module_.state_dict()
+    assert "random_layer_.random_matrix_0" in state_dict
+    new_method = CDAN(
+        ToyModule2D(),
+        reg=1,
+        num_features=10,
+        n_classes=2,
+        max_features=10,
+        layer_name="dropout",
+        batch_size=10,
+        max_epochs=2,
+        train_split=None,
+    )
+    new_method.initialize()
+    new_method.module_.load_state_dict(state_dict)
+    for matrix, new_matrix in zip(
+        random_layer.random_matrix, new_method.module_.random_layer_.random_matrix
+    ):
+        assert torch.equal(matrix, new_matrix)
+
+
 def test_missing_num_features():
     with pytest.raises(ValueError):
         DANN(
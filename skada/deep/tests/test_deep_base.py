@@ -214,6 +214,27 @@ def test_return_features():
     features = method.predict_features(torch.tensor(X_test))
     assert features.shape[1] == num_features
     assert features.shape[0] == X_test.shape[0]
+    assert not features.requires_grad
+
+    # with numpy array
+    features_np = method.predict_features(X_test)
+    assert torch.allclose(features, features_np)
+
+    # batch size smaller than the number of samples
+    method.set_params(batch_size=3)
+    features_batched = method.predict_features(torch.tensor(X_test))
+    assert torch.allclose(features, features_batched)
+
+    # the mode of the module is left unchanged
+    method.module_.train()
+    method.predict_features(torch.tensor(X_test))
+    assert method.module_.training
+    method.module_.eval()
+    method.predict_features(torch.tensor(X_test))
+    assert not method.module_.training
+
+    # the features are regular tensors that can be modified in place
+    method.predict_features(torch.tensor(X_test)).mul_(2)
 
 
 def test_domain_balanced_sampler():
@@ -7,9 +7,11 @@ import pytest
 pytest.importorskip("torch")
 
 import numpy as np
+import torch
 
 from skada.datasets import make_shifted_datasets
 from skada.deep import DeepJDOT
+from skada.deep.losses import deepjdot_loss
 from skada.deep.modules import ToyModule2D
 
 
@@ -49,3 +51,24 @@ def test_deepjdot():
     history = method.history_
 
     assert history[0]["train_loss"] > history[-1]["train_loss"]
+
+
+def test_deepjdot_loss_default_criterion():
+    rng = torch.Generator().manual_seed(42)
+    n_samples, n_classes, n_features = 10, 3, 5
+    y_s = torch.randint(n_classes, (n_samples,), generator=rng)
+    y_pred_t = torch.randn(n_samples, n_classes, generator=rng)
+    features_s = torch.randn(n_samples, n_features, generator=rng)
+    features_t = torch.randn(n_samples, n_features, generator=rng)
+
+    loss = deepjdot_loss(y_s, y_pred_t, features_s, features_t, reg_cl=1)
+    loss_ce = deepjdot_loss(
+        y_s,
+        y_pred_t,
+        features_s,
+        features_t,
+        reg_cl=1,
+        criterion=torch.nn.CrossEntropyLoss(reduction="none"),
+    )
+
+    assert torch.allclose(loss, loss_ce)
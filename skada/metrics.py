@@ -420,13 +420,13 @@ class DeepEmbeddedValidation(_BaseDomainAwareScorer):
 
         # 2 cases:
         # - features_train is a numpy array --> Do nothing
-        # - features_train is a torch.Tensor --> call detach().numpy()
+        # - features_train is a torch.Tensor --> call detach().cpu().numpy()
         if not isinstance(features_train, np.ndarray):
             # The transformer comes from a deep model
-            # and returns a torch.Tensor
-            features_train = features_train.detach().numpy()
-            features_val = features_val.detach().numpy()
-            features_target = features_target.detach().numpy()
+            # and returns a torch.Tensor, possibly on the GPU
+            features_train = features_train.detach().cpu().numpy()
+            features_val = features_val.detach().cpu().numpy()
+            features_target = features_target.detach().cpu().numpy()
 
         self._fit_adapt(features_train, features_target)
         N_train, N_target = len(features_train), len(features_target)